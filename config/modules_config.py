@@ -57,17 +57,21 @@ LICENSE_BUNDLES = {
     }
 }
 
+# Both lookups depend only on the constants above - resolve them once at import
+if LICENSE_TYPE in LICENSE_BUNDLES:
+    # Use bundle configuration
+    _ENABLED_MODULES = tuple(LICENSE_BUNDLES[LICENSE_TYPE]['modules'])
+else:
+    # Use individual module settings
+    _ENABLED_MODULES = tuple(key for key, config in AVAILABLE_MODULES.items() if config['enabled'])
+
+_MODULE_TABS = tuple((module['name'], key)
+                     for key in _ENABLED_MODULES if (module := AVAILABLE_MODULES.get(key)))
+
 def get_enabled_modules():
-    """Return list of enabled module keys"""
-    if LICENSE_TYPE in LICENSE_BUNDLES:
-        # Use bundle configuration
-        return LICENSE_BUNDLES[LICENSE_TYPE]['modules']
-    else:
-        # Use individual module settings
-        return [key for key, config in AVAILABLE_MODULES.items() if config['enabled']]
+    """Return tuple of enabled module keys"""
+    return _ENABLED_MODULES
 
 def get_module_tabs():
-    """Return list of (name, key) tuples for enabled modules"""
-    enabled = get_enabled_modules()
-    return [(AVAILABLE_MODULES[key]['name'], key) 
-            for key in enabled if key in AVAILABLE_MODULES]
+    """Return tuple of (name, key) tuples for enabled modules"""
+    return _MODULE_TABS
@@ -60,6 +60,7 @@ for idx, (tab_name, module_key) in enumerate(module_tabs_data):
             """, unsafe_allow_html=True)
         
         # Render module UI
+        # Module UIs are imported lazily so only enabled tabs pay the import cost
         if module_key == 'tree_converter':
             from modules.tree_converter import ui as tree_ui
             tree_ui.render()
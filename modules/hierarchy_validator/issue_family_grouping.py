@@ -16,19 +16,22 @@ Created: January 11, 2026
 Lab of Possibilities - Hierarchy Validator
 """
 
-from collections import defaultdict
+import sys
+from functools import lru_cache
 
 
 # ============================================================================
 # LAYER 1: NORMALIZATION
 # ============================================================================
 
+@lru_cache(maxsize=4096)
 def clean_name(name):
     """
     Normalize whitespace in member/parent names for grouping
     
     This is the CANONICAL whitespace normalization function.
     Used everywhere for consistency (DRY principle).
+    Memoized - the same names recur across every issue type.
     
     Normalization Rules:
     1. Strip leading/trailing whitespace
@@ -51,14 +54,11 @@ def clean_name(name):
     if not name or name == '—':
         return None
     
-    # Strip, replace tabs, collapse double spaces
-    normalized = name.strip().replace('\t', ' ')
-    
-    # Collapse multiple consecutive spaces to single space
-    while '  ' in normalized:
-        normalized = normalized.replace('  ', ' ')
-    
-    return normalized
+    # Strip, replace tabs, collapse multiple spaces - split() with no args
+    # does all three in one linear pass (no quadratic replace loop).
+    # Interned so spelling variants of one name share a single key object
+    # and family dict lookups match on identity.
+    return sys.intern(' '.join(name.split()))
 
 
 def get_family_key(issue):
@@ -88,20 +88,87 @@ def get_family_key(issue):
         {'Member Name': '—', 'Parent Name': 'Orphan Parent - Audit'}
             → "(Orphan) Orphan Parent - Audit"
     """
-    member_name = issue.get('Member Name', '')
+    # collect_all_issues always sets both fields, so index directly
+    member_name = issue['Member Name']
     
+    if member_name != '—':
+        return _family_key(member_name, None)
+    else:
+        return _family_key(member_name, issue['Parent Name'])
+
+
+@lru_cache(maxsize=4096)
+def _family_key(member_name, parent_name):
+    """Memoized body of get_family_key (parent_name only matters for orphans)"""
     if member_name != '—':
         # Use cleaned member name
         cleaned = clean_name(member_name)
         return cleaned if cleaned else member_name
     else:
         # Orphan - use cleaned parent name with prefix
-        parent_name = issue.get('Parent Name', '')
         cleaned_parent = clean_name(parent_name)
         if cleaned_parent:
-            return f"(Orphan) {cleaned_parent}"
+            return sys.intern(f"(Orphan) {cleaned_parent}")
         else:
-            return f"(Orphan) {parent_name}"
+            return sys.intern(f"(Orphan) {parent_name}")
+
+
+# Whitespace problem labels, in the order they appear in a Cause text
+_WS_LABELS = ('1 double space', 'leading space', 'trailing space', 'tab character')
+
+
+def whitespace_flags(text):
+    """
+    Bitmask of whitespace problems in text (bit i set -> _WS_LABELS[i])
+    
+    Each test is a single C-level scan (str.__contains__ / startswith /
+    endswith) - cheaper than a Python-level character loop on real names.
+    """
+    return (('  ' in text)
+            | text.startswith(' ') << 1
+            | text.endswith(' ') << 2
+            | ('\t' in text) << 3)
+
+
+def whitespace_labels(flags):
+    """Labels for a whitespace_flags() bitmask, in _WS_LABELS order"""
+    return [label for bit, label in enumerate(_WS_LABELS) if flags >> bit & 1]
+
+
+def valid_alias(alias):
+    """
+    True if alias is a usable value (not empty, not NaN, not the text 'nan')
+    
+    Same outcome as `alias and str(alias) != 'nan'` without building a
+    string per call - NaN is the only value that != itself.
+    """
+    return bool(alias) and alias == alias and alias != 'nan'
+
+
+_DIGITS = frozenset('0123456789')
+
+
+def format_name_with_alias(name, alias):
+    """
+    Append "(alias)" to names that contain digits, e.g. account codes
+    
+    Most names have no digits, so the isdisjoint check returns early
+    before the alias is even looked at.
+    """
+    if _DIGITS.isdisjoint(name) or not valid_alias(alias):
+        return name
+    return f"{name} ({alias})"
+
+
+def format_excel_rows(rows):
+    """
+    Comma-separated Excel row numbers for 0-based DataFrame row indices
+    
+    +2 accounts for the header row and Excel's 1-based numbering. Rows are
+    sorted here because duplicate instances and mismatch children are not
+    guaranteed to arrive in row order; timsort is linear on input that is.
+    """
+    return ', '.join([str(r + 2) for r in sorted(rows)])
 
 
 # ============================================================================
@@ -149,8 +216,7 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
     # ========================================================================
     for parent_str, data in orphan_errors.items():
         try:
-            excel_rows = [r + 2 for r in data['rows']]
-            rows_str = ', '.join(map(str, sorted(excel_rows)))
+            rows_str = format_excel_rows(data['rows'])
             
             if data.get('has_whitespace', False):
                 # Two sub-issues will be created later by numbering logic
@@ -167,15 +233,7 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
                 })
                 
                 # Sub-issue 2: Whitespace
-                ws_issues = []
-                if '  ' in parent_str:
-                    ws_issues.append('1 double space')
-                if parent_str.startswith(' '):
-                    ws_issues.append('leading space')
-                if parent_str.endswith(' '):
-                    ws_issues.append('trailing space')
-                if '\t' in parent_str:
-                    ws_issues.append('tab character')
+                ws_issues = whitespace_labels(whitespace_flags(parent_str))
                 
                 ws_cause = f"Parent name: {', '.join(ws_issues)}"
                 
@@ -210,17 +268,14 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
             excel_row = mismatch['correct_member_row'] + 2
             
             # Format member name with alias if numeric
-            member_name = mismatch["correct_member"]
-            member_alias = mismatch["correct_member_alias"]
-            if member_alias and str(member_alias) != 'nan':
-                if any(char.isdigit() for char in member_name):
-                    member_name = f"{member_name} ({member_alias})"
+            member_name = format_name_with_alias(
+                mismatch["correct_member"], mismatch["correct_member_alias"]
+            )
             
             parent_ref = mismatch["parent_ref"]
             cause = mismatch["cause_explanation"]
             
-            child_rows = [child['row'] + 2 for child in mismatch['affected_children']]
-            rows_str = ', '.join(map(str, sorted(child_rows)))
+            rows_str = format_excel_rows(child['row'] for child in mismatch['affected_children'])
             
             all_issues.append({
                 'Type': 'Error',
@@ -240,15 +295,11 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
     # ========================================================================
     for dup in duplicate_errors:
         try:
-            excel_rows = [inst['row'] + 2 for inst in dup['instances']]
-            rows_str = ', '.join(map(str, sorted(excel_rows)))
+            rows_str = format_excel_rows(inst['row'] for inst in dup['instances'])
             
             # Format name with alias if numeric
-            name = dup["member_name"]
             alias = dup['instances'][0]['alias'] if dup['instances'] else ''
-            if alias and str(alias) != 'nan':
-                if any(char.isdigit() for char in name):
-                    name = f"{name} ({alias})"
+            name = format_name_with_alias(dup["member_name"], alias)
             
             all_issues.append({
                 'Type': 'Error',
@@ -268,15 +319,11 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
     # ========================================================================
     for dup in duplicate_warnings:
         try:
-            excel_rows = [inst['row'] + 2 for inst in dup['instances']]
-            rows_str = ', '.join(map(str, sorted(excel_rows)))
+            rows_str = format_excel_rows(inst['row'] for inst in dup['instances'])
             
             # Format name with alias if numeric
-            name = dup["member_name"]
             alias = dup['instances'][0]['alias'] if dup['instances'] else ''
-            if alias and str(alias) != 'nan':
-                if any(char.isdigit() for char in name):
-                    name = f"{name} ({alias})"
+            name = format_name_with_alias(dup["member_name"], alias)
             
             all_issues.append({
                 'Type': 'Warning',
@@ -296,8 +343,7 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
     # ========================================================================
     for parent_str, data in orphan_warnings.items():
         try:
-            excel_rows = [r + 2 for r in data['rows']]
-            rows_str = ', '.join(map(str, sorted(excel_rows)))
+            rows_str = format_excel_rows(data['rows'])
             
             all_issues.append({
                 'Type': 'Warning',
@@ -317,22 +363,16 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
     # ========================================================================
     for text, data in whitespace_grouped.items():
         try:
-            member_rows = sorted(data['member_rows'])
-            parent_rows = sorted(data['parent_rows'])
+            member_rows = data['member_rows']
+            parent_rows = data['parent_rows']
             
             # Format name with alias if numeric
-            name = text
-            alias = data['alias']
-            if alias and str(alias) != 'nan':
-                if any(char.isdigit() for char in text):
-                    name = f"{text} ({alias})"
+            name = format_name_with_alias(text, data['alias'])
             
             # Determine if both columns or just one
             if member_rows and parent_rows:
                 # Both columns have the issue
-                all_rows = sorted(set(member_rows + parent_rows))
-                excel_rows = [r + 2 for r in all_rows]
-                rows_str = ', '.join(map(str, excel_rows))
+                rows_str = format_excel_rows(set(member_rows).union(parent_rows))
                 
                 issue_text = ', '.join(data['issues'])
                 cause = f"Both member and parent: {issue_text}"
@@ -348,8 +388,7 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
             
             elif member_rows:
                 # Only member column
-                excel_rows = [r + 2 for r in member_rows]
-                rows_str = ', '.join(map(str, excel_rows))
+                rows_str = format_excel_rows(member_rows)
                 
                 issue_text = ', '.join(data['issues'])
                 cause = f"Member name: {issue_text}"
@@ -365,8 +404,7 @@ def collect_all_issues(orphan_errors, orphan_warnings, mismatches,
             
             elif parent_rows:
                 # Only parent column
-                excel_rows = [r + 2 for r in parent_rows]
-                rows_str = ', '.join(map(str, excel_rows))
+                rows_str = format_excel_rows(parent_rows)
                 
                 issue_text = ', '.join(data['issues'])
                 cause = f"Parent name: {issue_text}"
@@ -444,11 +482,18 @@ def group_issues_by_family(all_issues):
             ]
         }
     """
-    families = defaultdict(list)
+    # Plain dict: a missing-key lookup downstream must not create an empty
+    # family. Lists grow by append - pre-sizing them needs a second keying
+    # pass that costs more than the amortized appends it saves.
+    families = {}
     
     for issue in all_issues:
         family_key = get_family_key(issue)
-        families[family_key].append(issue)
+        members = families.get(family_key)
+        if members is None:
+            families[family_key] = [issue]
+        else:
+            members.append(issue)
     
     return families
 
@@ -486,20 +531,20 @@ def assign_family_numbers(families):
         ]
     """
     numbered_issues = []
-    family_num = 1
     
-    for family_key, issues in families.items():
+    for family_num, issues in enumerate(families.values(), start=1):
+        prefix = f"#{family_num}"
         if len(issues) == 1:
             # Single issue - use #N format
-            issues[0]['Issue'] = f"#{family_num}"
-            numbered_issues.append(issues[0])
+            issues[0]['Issue'] = prefix
         else:
             # Multiple issues - use #N.1, #N.2, etc. format
+            prefix += '.'
             for sub_num, issue in enumerate(issues, start=1):
-                issue['Issue'] = f"#{family_num}.{sub_num}"
-                numbered_issues.append(issue)
+                issue['Issue'] = prefix + str(sub_num)
         
-        family_num += 1
+        # Whole family in one C-level extend (no per-issue append)
+        numbered_issues.extend(issues)
     
     return numbered_issues
 
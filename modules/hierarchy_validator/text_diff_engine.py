@@ -15,13 +15,19 @@ Version: 3.0.0 - Pipeline Pattern Refactor
 """
 
 from dataclasses import dataclass
+from html import escape
+from functools import lru_cache
 from typing import List, Tuple, Set, Optional
 from enum import Enum
 
+from rapidfuzz.distance import Levenshtein
+
 
 # ============================================================================
 # DATA STRUCTURES - The Building Blocks
 # ============================================================================
+# slots=True (Python 3.10+): no per-instance __dict__, fixed-offset attribute
+# reads - the DiffEngine creates one SemanticEdit per changed character.
 
 class EditType(Enum):
     """Semantic edit types - what ACTUALLY happened"""
@@ -32,7 +38,7 @@ class EditType(Enum):
     WHITESPACE = "whitespace"        # Whitespace issue
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SemanticEdit:
     """
     A semantic understanding of what changed
@@ -55,7 +61,7 @@ class SemanticEdit:
             return f"{self.edit_type.value.upper()}({self.correct_char}→{self.problem_char} at {self.position})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WhitespaceMap:
     """
     Tracks whitespace issues separately from character issues
@@ -73,7 +79,7 @@ class WhitespaceMap:
                    self.double_spaces or self.tabs)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CleanString:
     """
     A normalized string with position mapping back to original
@@ -102,61 +108,79 @@ class StringCleaner:
     """
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def analyze(text: str) -> CleanString:
         """
         Clean the string and map all whitespace issues
         
+        Memoized - one canonical correct_text is diffed against many problem
+        variants. Results are shared between callers: frozen, and the lists
+        inside must be treated as read-only.
+        
         Returns:
             CleanString with normalized text and full whitespace tracking
         """
-        whitespace_map = WhitespaceMap(
-            leading_spaces=[],
-            trailing_spaces=[],
-            double_spaces=[],
-            tabs=[]
-        )
-        
-        # Detect leading spaces
+        leading_spaces = []
+        trailing_spaces = []
+        double_spaces = []
+        tabs = []
+        n = len(text)
+        
+        if '\t' not in text and '\n' not in text:
+            # Fast path (most names): space is the only whitespace, so the
+            # classification is one C-level `in` check per class and double
+            # space runs can be located with str.find
+            position_map = [i for i, char in enumerate(text) if char != ' ']
+            find = text.find
+            i = find('  ')
+            while i >= 0:
+                end = i + 2
+                while end < n and text[end] == ' ':
+                    end += 1
+                double_spaces.append((i, end))
+                i = find('  ', end)
+        else:
+            # Single pass: tabs, runs of 2+ spaces and the position map.
+            # run_start is the index where the current run of spaces began.
+            position_map = []  # clean_pos -> original_pos (non-whitespace chars)
+            run_start = -1
+            for i, char in enumerate(text):
+                if char == ' ':
+                    if run_start < 0:
+                        run_start = i
+                    continue
+                if run_start >= 0:
+                    if i - run_start > 1:
+                        double_spaces.append((run_start, i))
+                    run_start = -1
+                if char == '\t':
+                    tabs.append(i)
+                elif char != '\n':
+                    position_map.append(i)
+            if run_start >= 0 and n - run_start > 1:
+                double_spaces.append((run_start, n))
+        
+        # Leading/trailing only touch the space runs at either end
         i = 0
-        while i < len(text) and text[i] == ' ':
-            whitespace_map.leading_spaces.append(i)
+        while i < n and text[i] == ' ':
+            leading_spaces.append(i)
             i += 1
-        
-        # Detect trailing spaces
-        i = len(text) - 1
+        i = n - 1
         while i >= 0 and text[i] == ' ':
-            whitespace_map.trailing_spaces.append(i)
+            trailing_spaces.append(i)
             i -= 1
         
-        # Detect double spaces and tabs
-        i = 0
-        while i < len(text):
-            if text[i] == '\t':
-                whitespace_map.tabs.append(i)
-            elif text[i] == ' ' and i + 1 < len(text) and text[i + 1] == ' ':
-                # Found double space - count the run
-                start = i
-                while i < len(text) and text[i] == ' ':
-                    i += 1
-                end = i
-                whitespace_map.double_spaces.append((start, end))
-                continue
-            i += 1
+        whitespace_map = WhitespaceMap(
+            leading_spaces=leading_spaces,
+            trailing_spaces=trailing_spaces,
+            double_spaces=double_spaces,
+            tabs=tabs
+        )
         
-        # Create clean version (normalize all whitespace to single spaces)
+        # Create clean version (normalize all whitespace to single spaces);
+        # split/join runs in C and beats building it char by char
         clean_text = ' '.join(text.split())
         
-        # Build position map (clean_pos -> original_pos)
-        position_map = []
-        clean_idx = 0
-        original_idx = 0
-        
-        while original_idx < len(text):
-            if text[original_idx] not in ' \t\n':
-                position_map.append(original_idx)
-                clean_idx += 1
-            original_idx += 1
-        
         return CleanString(
             clean_text=clean_text,
             original_text=text,
@@ -165,6 +189,10 @@ class StringCleaner:
         )
 
 
+# Characters never reported as typos/transpositions (whitespace is Layer 1's job)
+_WHITESPACE = frozenset(' \t\n')
+
+
 # ============================================================================
 # LAYER 2: DIFF ENGINE - The Intelligence (with Look-Ahead Buffer!)
 # ============================================================================
@@ -198,41 +226,57 @@ class DiffEngine:
         Returns:
             List of semantic edits (TRANSPOSITION, TYPO, DELETION, etc)
         """
-        from rapidfuzz import distance
-        
-        # Get raw Levenshtein operations
-        ops = distance.Levenshtein.editops(correct_text, problem_text)
-        ops_list = [(op.tag, op.src_pos, op.dest_pos) for op in ops]
+        # Equal (clean) texts have nothing to diff - skip Levenshtein
+        if correct_text == problem_text:
+            return []
+        
+        # Get raw Levenshtein operations as (tag, src_pos, dest_pos) tuples -
+        # as_list() builds them in C instead of reading three attributes off
+        # a Python Editop object per operation
+        ops_list = Levenshtein.editops(correct_text, problem_text).as_list()
+        n_ops = len(ops_list)
+        correct_len = len(correct_text)
+        problem_len = len(problem_text)
         
         semantic_edits = []
         i = 0
         
         # THE LOOK-AHEAD BUFFER (Auditor's recommendation!)
-        while i < len(ops_list):
+        while i < n_ops:
             op_type, src_pos, dest_pos = ops_list[i]
             
             # LOOK AHEAD: Check if this is part of a transposition
-            if i + 1 < len(ops_list):
+            if i + 1 < n_ops:
                 next_op_type, next_src_pos, next_dest_pos = ops_list[i + 1]
                 
                 # Pattern: INSERT + DELETE (Levenshtein's transposition signature)
-                if op_type == 'insert' and next_op_type == 'delete':
-                    transposition = DiffEngine._check_transposition(
-                        correct_text, problem_text,
-                        src_pos, dest_pos, next_src_pos, next_dest_pos
-                    )
-                    
-                    if transposition:
-                        semantic_edits.append(transposition)
+                # Same checks as _check_transposition, inlined (hot loop):
+                # adjacent in source, in bounds, not whitespace, swapped
+                if (op_type == 'insert' and next_op_type == 'delete'
+                        and next_src_pos == src_pos + 1
+                        and src_pos + 1 < correct_len and dest_pos + 1 < problem_len):
+                    correct_char_1 = correct_text[src_pos]
+                    correct_char_2 = correct_text[src_pos + 1]
+                    if (correct_char_1 not in _WHITESPACE and correct_char_2 not in _WHITESPACE
+                            and correct_char_1 == problem_text[dest_pos + 1]
+                            and correct_char_2 == problem_text[dest_pos]):
+                        # IT'S A TRANSPOSITION! 🎉
+                        semantic_edits.append(SemanticEdit(
+                            edit_type=EditType.TRANSPOSITION,
+                            position=dest_pos,
+                            correct_char=correct_char_1,
+                            problem_char=correct_char_2,
+                            pair_position=dest_pos + 1
+                        ))
                         i += 2  # CONSUME both operations
                         continue
             
             # Not a transposition - process as normal edit
             if op_type == 'delete':
                 # True deletion - character missing
-                if src_pos < len(correct_text):
+                if src_pos < correct_len:
                     correct_char = correct_text[src_pos]
-                    if correct_char not in ' \t\n':  # Skip whitespace deletions
+                    if correct_char not in _WHITESPACE:  # Skip whitespace deletions
                         semantic_edits.append(SemanticEdit(
                             edit_type=EditType.DELETION,
                             position=dest_pos,
@@ -242,10 +286,10 @@ class DiffEngine:
             
             elif op_type == 'replace':
                 # Typo - wrong character
-                if (src_pos < len(correct_text) and dest_pos < len(problem_text)):
+                if src_pos < correct_len and dest_pos < problem_len:
                     correct_char = correct_text[src_pos]
                     problem_char = problem_text[dest_pos]
-                    if correct_char not in ' \t\n' and problem_char not in ' \t\n':
+                    if correct_char not in _WHITESPACE and problem_char not in _WHITESPACE:
                         semantic_edits.append(SemanticEdit(
                             edit_type=EditType.TYPO,
                             position=dest_pos,
@@ -255,9 +299,9 @@ class DiffEngine:
             
             elif op_type == 'insert':
                 # Extra character
-                if dest_pos < len(problem_text):
+                if dest_pos < problem_len:
                     problem_char = problem_text[dest_pos]
-                    if problem_char not in ' \t\n':
+                    if problem_char not in _WHITESPACE:
                         semantic_edits.append(SemanticEdit(
                             edit_type=EditType.INSERTION,
                             position=dest_pos,
@@ -276,6 +320,9 @@ class DiffEngine:
         """
         Check if INSERT + DELETE pair is actually a transposition
         
+        DiffEngine.analyze inlines these same checks in its loop; this is
+        the readable reference version.
+        
         Safety checks (from Auditor feedback):
         1. Characters must be adjacent in source
         2. Characters must NOT be whitespace
@@ -300,7 +347,7 @@ class DiffEngine:
             return None
         
         # SAFETY CHECK 2: Must NOT be whitespace
-        if correct_char_1 in ' \t\n' or correct_char_2 in ' \t\n':
+        if correct_char_1 in _WHITESPACE or correct_char_2 in _WHITESPACE:
             return None
         
         # SAFETY CHECK 3: Characters must be swapped
@@ -369,6 +416,12 @@ class HtmlRenderer:
     COLOR_WHITESPACE_TEXT = "#c2410c"  # Dark orange text
     COLOR_ANNOTATION = "#dc2626"    # Red for [missing X]
     
+    # Span markup - static, only the inner text varies (styles: HIGHLIGHT_CSS)
+    _TYPO_OPEN = '<span class="highlight-error">'
+    _WHITESPACE_OPEN = '<span class="highlight-whitespace">'
+    _ANNOTATION_OPEN = '<span class="highlight-annotation">'
+    _SPAN_CLOSE = '</span>'
+    
     @staticmethod
     def render(problem_text: str, 
               semantic_edits: List[SemanticEdit],
@@ -387,111 +440,158 @@ class HtmlRenderer:
             Beautiful HTML string
         """
         result = []
+        append = result.append
+        text_len = len(problem_text)
+        # Spans are appended as open/text/close parts - no formatter call
+        # or string building per highlight. Text is HTML-escaped one segment
+        # at a time (names like "Sales & <Ops>" would otherwise break the
+        # markup); whitespace highlights are only ever ' ' or '\t'.
+        typo_open = HtmlRenderer._TYPO_OPEN
+        whitespace_open = HtmlRenderer._WHITESPACE_OPEN
+        annotation_open = HtmlRenderer._ANNOTATION_OPEN
+        close = HtmlRenderer._SPAN_CLOSE
         
         # Build position maps
         typo_positions = set()
-        transposition_positions = set()
-        annotation_map = {pos: text for pos, text in annotations}
+        annotation_map = dict(annotations)  # pos -> text, built in C
         
         for edit in semantic_edits:
             if edit.edit_type == EditType.TRANSPOSITION:
-                transposition_positions.add(edit.position)
+                typo_positions.add(edit.position)
                 if edit.pair_position:
-                    transposition_positions.add(edit.pair_position)
+                    typo_positions.add(edit.pair_position)
             elif edit.edit_type in (EditType.TYPO, EditType.INSERTION):
                 typo_positions.add(edit.position)
         
-        # Render character by character
+        whitespace_positions = HtmlRenderer._whitespace_positions(whitespace_map)
+        
+        # Render segment by segment: only positions that carry a highlight or
+        # an annotation are visited; the plain text between them is appended
+        # as one slice instead of character by character
+        events = sorted(p for p in (typo_positions | whitespace_positions | annotation_map.keys())
+                        if p < text_len)
         i = 0
-        while i < len(problem_text):
-            char = problem_text[i]
+        for pos in events:
+            if pos < i:
+                # Swallowed by the previous typo chunk
+                continue
+            if pos > i:
+                append(escape(problem_text[i:pos], quote=False))
+                i = pos
             
             # Insert inline annotations BEFORE the character
-            if i in annotation_map:
-                result.append(HtmlRenderer._render_annotation(annotation_map[i]))
+            if pos in annotation_map:
+                append(annotation_open)
+                append(escape(annotation_map[pos], quote=False))
+                append(close)
             
             # Check for whitespace issues
-            if HtmlRenderer._is_whitespace_issue(i, whitespace_map):
-                result.append(HtmlRenderer._render_whitespace(char))
-                i += 1
-                continue
+            if pos in whitespace_positions:
+                append(whitespace_open)
+                append(problem_text[pos])
+                append(close)
+                i = pos + 1
             
             # Check for character issues (typos/transpositions)
-            if i in typo_positions or i in transposition_positions:
+            elif pos in typo_positions:
                 # Find the chunk (consecutive issues)
-                chunk_start = i
-                chunk_end = i + 1
-                while (chunk_end < len(problem_text) and 
-                       (chunk_end in typo_positions or chunk_end in transposition_positions)):
+                chunk_end = pos + 1
+                while chunk_end < text_len and chunk_end in typo_positions:
                     chunk_end += 1
                 
                 # Render the chunk
-                chunk_text = problem_text[chunk_start:chunk_end]
-                result.append(HtmlRenderer._render_typo_chunk(chunk_text))
+                append(typo_open)
+                append(escape(problem_text[pos:chunk_end], quote=False))
+                append(close)
                 i = chunk_end
-                continue
-            
-            # Normal character
-            result.append(char)
-            i += 1
+        
+        # Remaining normal characters
+        if i < text_len:
+            append(escape(problem_text[i:], quote=False))
         
         # Add any trailing annotations
-        if len(problem_text) in annotation_map:
-            result.append(HtmlRenderer._render_annotation(annotation_map[len(problem_text)]))
+        if text_len in annotation_map:
+            append(annotation_open)
+            append(escape(annotation_map[text_len], quote=False))
+            append(close)
         
         return ''.join(result)
     
     @staticmethod
-    def _is_whitespace_issue(pos: int, whitespace_map: WhitespaceMap) -> bool:
-        """Check if this position has a whitespace issue"""
-        if pos in whitespace_map.leading_spaces:
-            return True
-        if pos in whitespace_map.trailing_spaces:
-            return True
-        if pos in whitespace_map.tabs:
-            return True
+    def _whitespace_positions(whitespace_map: WhitespaceMap) -> Set[int]:
+        """Positions that have a whitespace issue"""
+        positions = set(whitespace_map.leading_spaces)
+        positions.update(whitespace_map.trailing_spaces)
+        positions.update(whitespace_map.tabs)
         for start, end in whitespace_map.double_spaces:
-            if start < pos < end:  # Don't highlight the FIRST space (it's correct)
-                return True
-        return False
+            # Don't highlight the FIRST space (it's correct)
+            positions.update(range(start + 1, end))
+        return positions
     
     @staticmethod
     def _render_typo_chunk(text: str) -> str:
         """Render a chunk of characters with typo highlighting"""
-        return (f'<span style="background-color: {HtmlRenderer.COLOR_TYPO}; '
-                f'color: {HtmlRenderer.COLOR_TYPO_TEXT}; '
-                f'padding: 2px 4px; border-radius: 3px; font-weight: 500;">'
-                f'{text}</span>')
+        return HtmlRenderer._TYPO_OPEN + escape(text, quote=False) + HtmlRenderer._SPAN_CLOSE
     
     @staticmethod
     def _render_whitespace(char: str) -> str:
         """Render whitespace with orange highlighting"""
-        return (f'<span style="background-color: {HtmlRenderer.COLOR_WHITESPACE}; '
-                f'color: {HtmlRenderer.COLOR_WHITESPACE_TEXT}; '
-                f'padding: 2px 4px; border-radius: 3px; font-weight: 500;">'
-                f'{char}</span>')
+        return HtmlRenderer._WHITESPACE_OPEN + char + HtmlRenderer._SPAN_CLOSE
     
     @staticmethod
     def _render_annotation(text: str) -> str:
         """Render inline [missing X] annotation"""
-        return (f'<span style="color: {HtmlRenderer.COLOR_ANNOTATION}; '
-                f'font-size: 11px; font-weight: 400;">{text}</span>')
+        return HtmlRenderer._ANNOTATION_OPEN + escape(text, quote=False) + HtmlRenderer._SPAN_CLOSE
+
+
+# Span styles for the classes above - shipped once per page/iframe by the
+# caller instead of repeated inline on every highlighted character
+HIGHLIGHT_CSS = f"""
+.highlight-error {{
+    background-color: {HtmlRenderer.COLOR_TYPO};
+    color: {HtmlRenderer.COLOR_TYPO_TEXT};
+    padding: 2px 4px;
+    border-radius: 3px;
+    font-weight: 500;
+}}
+
+.highlight-whitespace {{
+    background-color: {HtmlRenderer.COLOR_WHITESPACE};
+    color: {HtmlRenderer.COLOR_WHITESPACE_TEXT};
+    padding: 2px 4px;
+    border-radius: 3px;
+    font-weight: 500;
+}}
+
+.highlight-annotation {{
+    color: {HtmlRenderer.COLOR_ANNOTATION};
+    font-size: 11px;
+    font-weight: 400;
+}}
+"""
 
 
 # ============================================================================
 # PUBLIC API - The Main Entry Point
 # ============================================================================
 
-def highlight_differences(correct_text: str, problem_text: str) -> str:
+@lru_cache(maxsize=8192)
+def highlight_differences(correct_text: str, problem_text: str, whitespace_only: bool = False) -> str:
     """
     The beautiful mille-feuille - all layers working together!
     
     This is the ONLY function that external code needs to call.
     Everything else is beautifully encapsulated.
     
+    Memoized: the same (correct, problem) pairs recur across rows and
+    across every Streamlit rerun, and the output is a pure function of them.
+    
     Args:
         correct_text: What the text should be
         problem_text: What the text actually is
+        whitespace_only: Caller already knows the texts differ only in
+            whitespace (e.g. has_typo is False) - skips cleaning correct_text
+            and the diff entirely
         
     Returns:
         Gorgeous HTML with Scandinavian highlighting
@@ -503,11 +603,25 @@ def highlight_differences(correct_text: str, problem_text: str) -> str:
         >>> # Returns: "Costs and expe<span...>sn</span>es  - Audit"
     """
     # Layer 1: Clean and analyze whitespace
-    clean_correct = StringCleaner.analyze(correct_text)
     clean_problem = StringCleaner.analyze(problem_text)
     
     # Layer 2: Get semantic edits (with look-ahead buffer!)
-    semantic_edits = DiffEngine.analyze(clean_correct.clean_text, clean_problem.clean_text)
+    # Whitespace-only variations (the common fixable case) and identical
+    # texts normalize to the same clean text - nothing for the DiffEngine
+    # to find, so skip Levenshtein
+    if whitespace_only or correct_text == problem_text:
+        semantic_edits = []
+    else:
+        clean_correct = StringCleaner.analyze(correct_text)
+        if clean_correct.clean_text == clean_problem.clean_text:
+            semantic_edits = []
+        else:
+            semantic_edits = DiffEngine.analyze(clean_correct.clean_text, clean_problem.clean_text)
+    
+    # Nothing to highlight at all - the renderer would emit the escaped
+    # text unchanged, so skip layers 3 and 4
+    if not semantic_edits and not clean_problem.whitespace_map.has_issues():
+        return escape(problem_text, quote=False)
     
     # Layer 3: Build annotations (suppress for transpositions)
     annotations = Annotator.build_annotations(semantic_edits)
@@ -6,17 +6,9 @@ Beautiful light-themed presentation with comprehensive validation display
 import streamlit as st
 import pandas as pd
 from collections import defaultdict
+from io import BytesIO
 import hashlib
 
-# Import validation engine
-from modules.hierarchy_validator.validation_engine import (
-    find_orphans,
-    find_parent_mismatches,
-    find_duplicate_members,
-    find_whitespace_issues,
-    find_whitespace_issues_detailed
-)
-
 # Import family grouping module (Item 3 - Family Grouping Logic)
 from modules.hierarchy_validator.issue_family_grouping import (
     collect_all_issues,
@@ -35,6 +27,53 @@ from shared.tooltip_helper import (
 )
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_hierarchy_file(file_hash, file_name, _file_content):
+    """
+    Parse an uploaded hierarchy file
+    
+    Cached on the file's content hash (the raw bytes are not re-hashed), so
+    reruns and re-uploads of the same file skip parsing.
+    """
+    buffer = BytesIO(_file_content)
+    if file_name.endswith('.csv'):
+        return pd.read_csv(buffer)
+    
+    # calamine (Rust) parses .xlsx/.xls much faster than openpyxl/xlrd;
+    # fall back to pandas' default engine if python-calamine isn't installed
+    # (ImportError) or pandas predates the engine (<2.2, ValueError)
+    try:
+        return pd.read_excel(buffer, engine='calamine')
+    except (ImportError, ValueError):
+        buffer.seek(0)
+        return pd.read_excel(buffer)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _run_validations(file_hash, _df):
+    """
+    Run all validators on a parsed file
+    
+    Keyed on the file's content hash - hashing the DataFrame itself would
+    sample rows on large files. Returns plain dicts (the validators' lambda
+    defaultdicts can't be pickled into the cache).
+    """
+    # Imported here so the page loads without rapidfuzz until a file arrives
+    from modules.hierarchy_validator.validation_engine import (
+        find_orphans,
+        find_parent_mismatches,
+        find_duplicate_members,
+        find_whitespace_issues
+    )
+    
+    orphan_errors, orphan_warnings = find_orphans(_df, max_edit_distance=2)
+    mismatches = find_parent_mismatches(_df, max_edit_distance=2)
+    duplicate_errors, duplicate_warnings = find_duplicate_members(_df)
+    whitespace_issues = find_whitespace_issues(_df)
+    return (dict(orphan_errors), dict(orphan_warnings), mismatches,
+            duplicate_errors, duplicate_warnings, whitespace_issues)
+
+
 def render(workflow_data=None):
     # File upload or workflow data
     if workflow_data is not None:
@@ -81,10 +120,7 @@ def render(workflow_data=None):
             
             try:
                 # Read file based on type
-                if uploaded_file.name.endswith('.csv'):
-                    df = pd.read_csv(uploaded_file)
-                else:
-                    df = pd.read_excel(uploaded_file)
+                df = _read_hierarchy_file(file_hash, uploaded_file.name, file_content)
             
                 # Validate required columns
                 if '_member_name' not in df.columns or '_parent_name' not in df.columns:
@@ -99,10 +135,9 @@ def render(workflow_data=None):
                 if st.button("Validate Hierarchy", type="primary", use_container_width=True):
                     # Run analysis
                     with st.spinner("Analyzing..."):
-                        orphan_errors, orphan_warnings = find_orphans(df, max_edit_distance=2)
-                        mismatches = find_parent_mismatches(df, max_edit_distance=2)
-                        duplicate_errors, duplicate_warnings = find_duplicate_members(df)
-                        whitespace_issues = find_whitespace_issues(df)
+                        (orphan_errors, orphan_warnings, mismatches,
+                         duplicate_errors, duplicate_warnings,
+                         whitespace_issues) = _run_validations(file_hash, df)
             
                     # AUDITOR PATTERN: Promote validation results to Session State
                     # "Data must outlive the interaction"
@@ -179,41 +214,30 @@ def render(workflow_data=None):
                         flagged_member_column_rows = set()
                         flagged_parent_column_rows = set()
                         
+                        # (Row lists are fed to set.update in bulk - one call per
+                        # source instead of a Python-level add per row)
+                        
                         # Rows from orphan errors (parent column flagged)
-                        for parent_str, data in orphan_errors.items():
-                            for row in data['rows']:
-                                flagged_parent_column_rows.add(row)
+                        for data in orphan_errors.values():
+                            flagged_parent_column_rows.update(data['rows'])
                         
                         # Rows from orphan warnings (parent column flagged)
-                        for parent_str, data in orphan_warnings.items():
-                            for row in data['rows']:
-                                flagged_parent_column_rows.add(row)
+                        for data in orphan_warnings.values():
+                            flagged_parent_column_rows.update(data['rows'])
                         
                         # Rows from parent mismatches (parent column flagged)
                         for mismatch in mismatches:
-                            for child in mismatch['affected_children']:
-                                flagged_parent_column_rows.add(child['row'])
+                            flagged_parent_column_rows.update(child['row'] for child in mismatch['affected_children'])
                         
                         # Rows from duplicates (member column flagged)
                         for dup in duplicate_errors + duplicate_warnings:
-                            for inst in dup['instances']:
-                                flagged_member_column_rows.add(inst['row'])
+                            flagged_member_column_rows.update(inst['row'] for inst in dup['instances'])
                         
                         # Build set of parent names already flagged with issues
-                        flagged_parent_names = set()
-                        
-                        # Parent names from orphan errors
-                        for parent_str in orphan_errors.keys():
-                            flagged_parent_names.add(parent_str)
-                        
-                        # Parent names from orphan warnings
-                        for parent_str in orphan_warnings.keys():
-                            flagged_parent_names.add(parent_str)
-                        
-                        # Parent names from mismatches with whitespace
-                        for mismatch in mismatches:
-                            if mismatch['is_whitespace']:
-                                flagged_parent_names.add(mismatch['parent_ref'])
+                        # (orphan errors + orphan warnings + mismatches with whitespace)
+                        flagged_parent_names = set(orphan_errors)
+                        flagged_parent_names.update(orphan_warnings)
+                        flagged_parent_names.update(m['parent_ref'] for m in mismatches if m['is_whitespace'])
                         
                         # Group whitespace issues by text to find duplicates across columns
                         ws_grouped = defaultdict(lambda: {'member_rows': [], 'parent_rows': [], 'issues': [], 'alias': ''})
@@ -232,40 +256,57 @@ def render(workflow_data=None):
                             if not unflagged_rows:
                                 continue
                             
-                            text = ws['highlighted']
+                            # One lookup per issue - reuse the group entry below
+                            group = ws_grouped[ws['highlighted']]
                             
                             if ws['column'] == '_member_name':
-                                ws_grouped[text]['member_rows'].extend(unflagged_rows)
+                                group['member_rows'].extend(unflagged_rows)
                             else:
-                                ws_grouped[text]['parent_rows'].extend(unflagged_rows)
+                                group['parent_rows'].extend(unflagged_rows)
                             
-                            ws_grouped[text]['issues'] = ws['issues']
-                            ws_grouped[text]['alias'] = ws['alias_example']
+                            group['issues'] = ws['issues']
+                            group['alias'] = ws['alias_example']
                         
                         # Collect Vena length violations
+                        # Lengths are measured column-wise; only the (rare) rows over
+                        # the limit are visited in Python, in row order
+                        # (a missing value can't exceed 80 chars, so no 'nan' test)
                         vena_length_violations = []
-                        for idx, row in df.iterrows():
-                            member = str(row['_member_name'])
-                            parent = str(row['_parent_name'])
-                            row_num = idx + 2  # Excel row (1-indexed + header)
-                            
-                            # Check member name length
-                            if member and member != 'nan' and len(member) > 80:
-                                vena_length_violations.append({
-                                    'row': row_num,
-                                    'column': 'Member',
-                                    'name': member,
-                                    'length': len(member)
-                                })
-                            
-                            # Check parent name length
-                            if parent and parent != 'nan' and len(parent) > 80:
-                                vena_length_violations.append({
-                                    'row': row_num,
-                                    'column': 'Parent',
-                                    'name': parent,
-                                    'length': len(parent)
-                                })
+                        member_str = df['_member_name'].astype(str)
+                        parent_str = df['_parent_name'].astype(str)
+                        member_len = member_str.str.len()
+                        parent_len = parent_str.str.len()
+                        member_too_long = member_len > 80
+                        parent_too_long = parent_len > 80
+                        any_too_long = member_too_long | parent_too_long
+                        # Most files have no over-long names - one reduction over the
+                        # mask skips the masked gathers below entirely
+                        if any_too_long.any():
+                            for idx, member_bad, parent_bad, member, parent, m_len, p_len in zip(
+                                df.index[any_too_long],
+                                member_too_long[any_too_long], parent_too_long[any_too_long],
+                                member_str[any_too_long], parent_str[any_too_long],
+                                member_len[any_too_long], parent_len[any_too_long]
+                            ):
+                                row_num = idx + 2  # Excel row (1-indexed + header)
+                                
+                                # Check member name length
+                                if member_bad:
+                                    vena_length_violations.append({
+                                        'row': row_num,
+                                        'column': 'Member',
+                                        'name': member,
+                                        'length': int(m_len)
+                                    })
+                                
+                                # Check parent name length
+                                if parent_bad:
+                                    vena_length_violations.append({
+                                        'row': row_num,
+                                        'column': 'Parent',
+                                        'name': parent,
+                                        'length': int(p_len)
+                                    })
                         
                         # Now use the new modular approach
                         all_issues = collect_all_issues(
@@ -299,9 +340,9 @@ def render(workflow_data=None):
                             for issue in master_table:
                                 if issue['Member Name'] != '—':
                                     cleaned = clean_name(issue['Member Name'])
-                                    if cleaned and cleaned not in member_name_map:
+                                    if cleaned:
                                         # Use the first (cleanest) version as canonical
-                                        member_name_map[cleaned] = issue['Member Name']
+                                        member_name_map.setdefault(cleaned, issue['Member Name'])
                             
                             # Group issues by their LOGICAL grouping key
                             # NOTE: We group for FILTERING purposes only, NOT for numbering!
@@ -404,11 +445,10 @@ def render(workflow_data=None):
                                         # Not a whitespace warning - always keep it
                                         final_table.append(issue)  # ← Preserve Issue number!
                     
-                            df_master = pd.DataFrame(final_table)
-                            
-                            # Reorder columns to put Issue first (left-most)
+                            # Build straight into the display column order (Issue first,
+                            # left-most) - one constructor pass, no reorder copy
                             column_order = ['Issue', 'Type', 'Category', 'Member Name', 'Parent Name', 'Cause', 'Rows']
-                            df_master = df_master[column_order]
+                            df_master = pd.DataFrame.from_records(final_table, columns=column_order)
                             
                             # AUDITOR RECOMMENDATION (Item 3 - Fix 2):
                             # Ensure row height accommodates wrapped issue lists
@@ -10,7 +10,8 @@ from rapidfuzz import fuzz, distance
 
 def get_member_display(member, alias):
     """Format member display with alias"""
-    if alias and str(alias) != 'nan':
+    # alias == alias is False only for NaN; avoids a str() per call
+    if alias and alias == alias and alias != 'nan':
         return f"{member} ({alias})"
     return member
 
@@ -160,7 +161,9 @@ def count_children_fuzzy(df, member_name, max_edit_distance=2):
             if parent_str == member_name:
                 total_children += 1
             else:
-                edit_dist = distance.Levenshtein.distance(member_name, parent_str)
+                # score_cutoff lets rapidfuzz stop as soon as the pair is
+                # known to be further apart than max_edit_distance
+                edit_dist = distance.Levenshtein.distance(member_name, parent_str, score_cutoff=max_edit_distance)
                 if 1 <= edit_dist <= max_edit_distance:
                     total_children += 1
     return total_children
@@ -195,7 +198,7 @@ def find_orphans(df, max_edit_distance=2):
             # Check if parent exists (fuzzy match)
             has_fuzzy_match = False
             for member in member_names:
-                edit_dist = distance.Levenshtein.distance(parent_str, member)
+                edit_dist = distance.Levenshtein.distance(parent_str, member, score_cutoff=max_edit_distance)
                 if 1 <= edit_dist <= max_edit_distance:
                     has_fuzzy_match = True
                     break
@@ -211,13 +214,10 @@ def find_orphans(df, max_edit_distance=2):
                 
                 if has_leading or has_trailing or has_tabs or has_double_spaces:
                     # ERROR: Has whitespace issues that will cause Vena problems
-                    orphan_errors[parent_str]['rows'].append(idx)
-                    orphan_errors[parent_str]['has_whitespace'] = True
-                    
-                    if has_leading or has_trailing or has_tabs:
-                        orphan_errors[parent_str]['is_vena_invalid'] = True
-                    else:
-                        orphan_errors[parent_str]['is_vena_invalid'] = False
+                    entry = orphan_errors[parent_str]
+                    entry['rows'].append(idx)
+                    entry['has_whitespace'] = True
+                    entry['is_vena_invalid'] = has_leading or has_trailing or has_tabs
                 else:
                     # WARNING: Clean reference, may exist in Vena already
                     orphan_warnings[parent_str]['rows'].append(idx)
@@ -238,6 +238,7 @@ def find_parent_mismatches(df, max_edit_distance=2):
     
     mismatches = []
     processed_parents = set()
+    children_by_parent = None  # parent_str -> [(row, member, alias)], built on first mismatch
     
     for idx, row in df.iterrows():
         parent_ref = row['_parent_name']
@@ -251,11 +252,17 @@ def find_parent_mismatches(df, max_edit_distance=2):
                 best_match = None
                 min_distance = float('inf')
                 
+                cutoff = max_edit_distance
                 for member in member_names.keys():
-                    edit_dist = distance.Levenshtein.distance(parent_str, member)
-                    if 1 <= edit_dist <= max_edit_distance and edit_dist < min_distance:
+                    # Only a strictly closer match can win, so the cutoff
+                    # shrinks as matches are found (rapidfuzz exits early)
+                    edit_dist = distance.Levenshtein.distance(parent_str, member, score_cutoff=cutoff)
+                    if 1 <= edit_dist <= cutoff and edit_dist < min_distance:
                         min_distance = edit_dist
                         best_match = member
+                        if edit_dist == 1:
+                            break  # Nothing closer than 1 can replace it
+                        cutoff = edit_dist - 1
                 
                 if best_match:
                     # Classify the difference
@@ -268,22 +275,30 @@ def find_parent_mismatches(df, max_edit_distance=2):
                         processed_parents.add(parent_str)
                         continue
                     
+                    if children_by_parent is None:
+                        # One pass over the columns instead of a full iterrows() per mismatch
+                        aliases = df['_member_alias'] if '_member_alias' in df.columns else [''] * len(df)
+                        children_by_parent = {}
+                        for child_idx, child_parent, child_member, child_alias in zip(
+                                df.index, df['_parent_name'], df['_member_name'], aliases):
+                            if pd.notna(child_parent):
+                                children_by_parent.setdefault(str(child_parent), []).append(
+                                    (child_idx, child_member, child_alias))
+                    
+                    # CRITICAL FIX: Only include children that have the EXACT parent_str we're processing
+                    # Not just any parent close to best_match!
+                    child_edit_dist = distance.Levenshtein.distance(best_match, parent_str)
+                    similarity = fuzz.ratio(best_match, parent_str)
                     children = []
-                    for child_idx, child_row in df.iterrows():
-                        child_parent = str(child_row['_parent_name']) if pd.notna(child_row['_parent_name']) else None
-                        # CRITICAL FIX: Only include children that have the EXACT parent_str we're processing
-                        # Not just any parent close to best_match!
-                        if child_parent == parent_str:
-                            child_edit_dist = distance.Levenshtein.distance(best_match, child_parent)
-                            similarity = fuzz.ratio(best_match, child_parent)
-                            children.append({
-                                'row': child_idx,
-                                'member': str(child_row['_member_name']),
-                                'alias': child_row.get('_member_alias', '') if '_member_alias' in df.columns else '',
-                                'parent_name': child_parent,
-                                'edit_distance': child_edit_dist,
-                                'similarity': similarity
-                            })
+                    for child_idx, child_member, child_alias in children_by_parent.get(parent_str, ()):
+                        children.append({
+                            'row': child_idx,
+                            'member': str(child_member),
+                            'alias': child_alias,
+                            'parent_name': parent_str,  # one shared object for all children
+                            'edit_distance': child_edit_dist,
+                            'similarity': similarity
+                        })
                     
                     if children:
                         mismatches.append({
@@ -334,6 +349,11 @@ def find_duplicate_members(df):
     
     return duplicate_errors, duplicate_warnings
 
+def _detect_whitespace_mask(series):
+    """Vectorized check: True where the value has leading/trailing spaces, tabs or double spaces"""
+    return (series.str.startswith(' ') | series.str.endswith(' ')
+            | series.str.contains('\t', regex=False) | series.str.contains('  ', regex=False))
+
 def find_whitespace_issues(df):
     """Find ALL whitespace issues for fixing (double spaces, leading, trailing, tabs)
     
@@ -341,7 +361,12 @@ def find_whitespace_issues(df):
     """
     grouped_issues = defaultdict(lambda: {'rows': [], 'alias_example': '', 'issues': []})
     
-    for idx, row in df.iterrows():
+    # Pre-filter with pandas string kernels - only rows with a whitespace
+    # problem in either column reach the per-row loop below
+    member_mask = _detect_whitespace_mask(df['_member_name'].astype(str))
+    parent_mask = df['_parent_name'].notna() & _detect_whitespace_mask(df['_parent_name'].astype(str))
+    
+    for idx, row in df[member_mask | parent_mask].iterrows():
         member = str(row['_member_name'])
         parent = str(row['_parent_name']) if pd.notna(row['_parent_name']) else None
         member_alias = row.get('_member_alias', '') if '_member_alias' in df.columns else ''
@@ -358,10 +383,10 @@ def find_whitespace_issues(df):
             member_issues.append("tab character")
         
         if member_issues:
-            key = ('_member_name', member)
-            grouped_issues[key]['rows'].append(idx)
-            grouped_issues[key]['alias_example'] = member_alias if pd.notna(member_alias) else ''
-            grouped_issues[key]['issues'] = member_issues
+            entry = grouped_issues[('_member_name', member)]
+            entry['rows'].append(idx)
+            entry['alias_example'] = member_alias if pd.notna(member_alias) else ''
+            entry['issues'] = member_issues
         
         # Check parent name - ALL whitespace issues
         if parent:
@@ -376,10 +401,10 @@ def find_whitespace_issues(df):
                 parent_issues.append("tab character")
             
             if parent_issues:
-                key = ('_parent_name', parent)
-                grouped_issues[key]['rows'].append(idx)
-                grouped_issues[key]['alias_example'] = member_alias if pd.notna(member_alias) else ''
-                grouped_issues[key]['issues'] = parent_issues
+                entry = grouped_issues[('_parent_name', parent)]
+                entry['rows'].append(idx)
+                entry['alias_example'] = member_alias if pd.notna(member_alias) else ''
+                entry['issues'] = parent_issues
     
     whitespace_issues = []
     for (column, text), data in grouped_issues.items():
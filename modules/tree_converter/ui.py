@@ -7,12 +7,8 @@ import streamlit as st
 import pandas as pd
 import io
 from datetime import datetime
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from shared.workflow import send_to_module
 
 def render(workflow_receiver=None):
@@ -238,7 +234,9 @@ def render(workflow_receiver=None):
                     with col3:
                         # WORKFLOW: Send to validator
                         if st.button("→ Validate This", type="primary", width="stretch", key="tree_send_to_validator"):
-                            send_to_module(df.copy(), 'tree_converter', 'hierarchy_validator')
+                            # No defensive copy: the validator only reads the frame, and this
+                            # module never mutates its result in place (only rebinds it)
+                            send_to_module(df, 'tree_converter', 'hierarchy_validator')
                             st.success("✓ Data sent to Hierarchy Validator!")
                             st.info("Switch to the Hierarchy Validator tab to continue")
                     